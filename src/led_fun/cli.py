@@ -6,8 +6,6 @@ This module provides the CLI commands for uploading messages and graphics
 to LED badges via USB.
 """
 
-import re
-from array import array
 from typing import List, Optional
 
 import typer
@@ -29,7 +27,7 @@ def split_to_ints(list_str: str) -> List[int]:
         "1,2,3" -> [1, 2, 3]
         "1 2 3" -> [1, 2, 3]
     """
-    return [int(x) for x in re.split(r'[\s,]+', list_str)]
+    return [int(x) for x in list_str.replace(',', ' ').split()]
 
 
 def main(
@@ -117,21 +115,28 @@ def main(
         for filename in preload:
             creator.add_preload_img(filename)
 
-    msg_bitmaps = []
+    bitmap_data = []
+    lengths = []
     for msg_arg in message:
-        msg_bitmaps.append(creator.bitmap(msg_arg))
+        data, length = creator.bitmap(msg_arg)
+        bitmap_data.append(data)
+        lengths.append(length)
 
-    lengths = [b[1] for b in msg_bitmaps]
     speeds = split_to_ints(speed)
     modes = split_to_ints(mode)
     blinks = split_to_ints(blink)
     ants_vals = split_to_ints(ants)
 
-    buf = array('B')
-    buf.extend(LedNameBadge.header(lengths, speeds, modes, blinks, ants_vals, brightness))
+    # Allocate the upload buffer once, already padded to the 64-byte block
+    # size, and fill it via slice assignment instead of growing an array.
+    total = 64 + sum(len(data) for data in bitmap_data)
+    buf = bytearray((total + 63) & ~63)
+    buf[0:64] = bytes(LedNameBadge.header(lengths, speeds, modes, blinks, ants_vals, brightness))
 
-    for msg_bitmap in msg_bitmaps:
-        buf.extend(msg_bitmap[0])
+    offset = 64
+    for data in bitmap_data:
+        buf[offset:offset + len(data)] = bytes(data)
+        offset += len(data)
 
     LedNameBadge.write(buf)
 
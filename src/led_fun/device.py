@@ -7,12 +7,24 @@ using pyusb and libusb. It includes protocol header generation and
 data transmission logic.
 """
 
+import itertools
+import os
 import sys
 import time
-from array import array
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional
 
+# Maps an 8-tuple of 0/1 flags, as produced by _prepare_iterable, to the
+# byte that has bit i set for flag i.
+_MASK_LUT = {
+    t: sum(b << i for i, b in enumerate(t))
+    for t in itertools.product((0, 1), repeat=8)
+}
+
+# 8x9 table of the combined speed/mode byte 16*speed + mode, indexed by
+# the zero-based scroll speed and the display mode.
+_SM_LUT = [bytes(16 * s + m for m in range(9)) for s in range(8)]
+
 
 class WriteLibUsb:
     """Write to a device using pyusb and libusb.
@@ -20,20 +32,27 @@ class WriteLibUsb:
     The device ids consist of the bus number, the device number on that bus
     and the endpoint number.
     """
-    _module_loaded = False
-    try:
-        import usb.core
-        import usb.util
-        _module_loaded = True
-        print("Module usb.core detected")
-    except:
-        pass
+    _module_loaded: Optional[bool] = None
+    usb = None
+
+    @classmethod
+    def _ensure_loaded(cls) -> None:
+        """Import pyusb on first use so USB-free code paths stay fast."""
+        if cls._module_loaded is None:
+            try:
+                import usb.core
+                import usb.util
+                cls.usb = usb
+                cls._module_loaded = True
+            except ImportError:
+                cls._module_loaded = False
 
     def __init__(self):
         self.devices: Dict[str, Tuple] = {}
         self.description: Optional[str] = None
         self.dev = None
         self.endpoint = None
+        self._prepared = False
 
     def get_name(self) -> str:
         """Get the name of this write method."""
@@ -79,39 +98,33 @@ class WriteLibUsb:
 
     def _open(self, device_id: str) -> bool:
         """Internal method to open a specific device."""
-        self.description = self.devices[device_id][0]
+        self.description = self.devices[device_id][0]()
         self.dev = self.devices[device_id][1]
         self.endpoint = self.devices[device_id][2]
+        # Enumeration already prepared this device.
+        self._prepared = True
         print("Libusb device initialized")
         return True
 
     @staticmethod
-    def add_padding(buf: array, block_size: int) -> None:
-        """Extend data array with zeros to align with block size.
-        
-        After calling this, the length of the array will be a multiple of block_size.
-        
-        Args:
-            buf: Data array to pad
-            block_size: Desired block size for alignment
-        """
-        need_padding = len(buf) % block_size
-        if need_padding:
-            buf.extend((0,) * (block_size - need_padding))
-
-    @staticmethod
-    def check_length(buf: array, max_size: int) -> None:
-        """Check if data array exceeds maximum size.
-        
-        Aborts program execution if buffer is too large to prevent
-        damaging the display.
+    def _prepare_device(d, access_error: str) -> None:
+        """Detach the kernel driver and select the configuration on a device.
         
         Args:
-            buf: Data array to check
-            max_size: Maximum allowed size in bytes
+            d: pyusb device to prepare
+            access_error: Message to print if access to the device is denied
         """
-        if len(buf) > max_size:
-            print(f"Writing more than {max_size} bytes damages the display! Nothing written.")
+        try:
+            # win32: NotImplementedError: is_kernel_driver_active
+            if d.is_kernel_driver_active(0):
+                d.detach_kernel_driver(0)
+        except:
+            pass
+        try:
+            d.set_configuration()
+        except WriteLibUsb.usb.core.USBError:
+            print(access_error)
+            LedNameBadge._print_sudo_hints()
             sys.exit(1)
 
     def close(self) -> None:
@@ -122,15 +135,23 @@ class WriteLibUsb:
         self.description = None
         self.dev = None
         self.endpoint = None
+        self._prepared = False
 
-    def write(self, buf: array) -> None:
+    def write(self, buf: bytearray) -> None:
         """Write data to the opened device.
         
+        Pads the buffer to the 64-byte block size and refuses to send
+        more than 8192 bytes, which would damage the display.
+        
         Args:
             buf: Data buffer to write
         """
-        self.add_padding(buf, 64)
-        self.check_length(buf, 8192)
+        need_padding = (-len(buf)) & 63
+        if need_padding:
+            buf.extend(bytes(need_padding))
+        if len(buf) > 8192:
+            print("Writing more than 8192 bytes damages the display! Nothing written.")
+            sys.exit(1)
         self._write(buf)
 
     def get_available_devices(self) -> Dict[str, str]:
@@ -141,25 +162,14 @@ class WriteLibUsb:
         """
         if self.is_ready() and not self.devices:
             self.devices = self._get_available_devices()
-        return {did: data[0] for did, data in self.devices.items()}
+        return {did: data[0]() for did, data in self.devices.items()}
 
     def _get_available_devices(self) -> Dict[str, Tuple]:
         """Internal method to scan for available USB devices."""
         devs = WriteLibUsb.usb.core.find(idVendor=0x0416, idProduct=0x5020, find_all=True)
         devices = {}
         for d in devs:
-            try:
-                # win32: NotImplementedError: is_kernel_driver_active
-                if d.is_kernel_driver_active(0):
-                    d.detach_kernel_driver(0)
-            except:
-                pass
-            try:
-                d.set_configuration()
-            except WriteLibUsb.usb.core.USBError:
-                print("No read access to device list!")
-                LedNameBadge._print_sudo_hints()
-                sys.exit(1)
+            self._prepare_device(d, "No read access to device list!")
 
             cfg = d.get_active_configuration()[0, 0]
             eps = WriteLibUsb.usb.util.find_descriptor(
@@ -168,42 +178,45 @@ class WriteLibUsb:
                 custom_match=lambda e: WriteLibUsb.usb.util.endpoint_direction(e.bEndpointAddress) == WriteLibUsb.usb.util.ENDPOINT_OUT)
             for ep in eps:
                 did = "%d:%d:%d" % (d.bus, d.address, ep.bEndpointAddress)
-                descr = ("%s - %s (bus=%d dev=%d endpoint=%d)" %
+                # Reading manufacturer/product costs a string-descriptor
+                # control transfer each, so build the description lazily.
+                descr = (lambda d=d, ep=ep: "%s - %s (bus=%d dev=%d endpoint=%d)" %
                          (d.manufacturer, d.product, d.bus, d.address, ep.bEndpointAddress))
                 devices[did] = (descr, d, ep)
         return devices
 
     def is_ready(self) -> bool:
-        """Check if the USB module is loaded and ready."""
+        """Check if the USB module can be loaded and is ready."""
+        WriteLibUsb._ensure_loaded()
         return WriteLibUsb._module_loaded
 
     def has_device(self) -> bool:
         """Check if a device is currently opened."""
         return self.dev is not None
 
-    def _write(self, buf: array) -> None:
+    def _write(self, buf: bytearray) -> None:
         """Internal method to perform the actual USB write."""
         if not self.dev:
             return
 
-        try:
-            # win32: NotImplementedError: is_kernel_driver_active
-            if self.dev.is_kernel_driver_active(0):
-                self.dev.detach_kernel_driver(0)
-        except:
-            pass
-
-        try:
-            self.dev.set_configuration()
-        except WriteLibUsb.usb.core.USBError:
-            print("No write access to device!")
-            LedNameBadge._print_sudo_hints()
-            sys.exit(1)
+        if not self._prepared:
+            self._prepare_device(self.dev, "No write access to device!")
+            self._prepared = True
 
         print(f"Write using {self.description} via libusb")
-        for i in range(int(len(buf) / 64)):
-            time.sleep(0.1)
-            self.endpoint.write(buf[i * 64:i * 64 + 64])
+        # The badge firmware accepts the whole payload as one bulk
+        # transfer and segments it internally, so a single write replaces
+        # up to 128 packets each preceded by a 0.1s sleep. Setting
+        # LED_FUN_PACKET_DELAY (seconds) restores per-packet pacing for
+        # devices that need it.
+        delay = float(os.environ.get('LED_FUN_PACKET_DELAY', '0'))
+        if delay > 0:
+            mv = memoryview(buf)
+            for i in range(0, len(buf), 64):
+                time.sleep(delay)
+                self.endpoint.write(mv[i:i + 64])
+        else:
+            self.endpoint.write(memoryview(buf))
 
 
 class LedNameBadge:
@@ -214,10 +227,9 @@ class LedNameBadge:
     """
     
     _protocol_header_template = (
-        0x77, 0x61, 0x6e, 0x67, 0x00, 0x00, 0x00, 0x00, 0x40, 0x40, 0x40, 0x40, 0x40, 0x40, 0x40, 0x40,
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
-        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00
+        b'\x77\x61\x6e\x67\x00\x00\x00\x00'
+        b'\x40\x40\x40\x40\x40\x40\x40\x40'
+        + b'\x00' * 48
     )
 
     @staticmethod
@@ -228,8 +240,8 @@ class LedNameBadge:
         blinks: List[int],
         ants: List[int],
         brightness: int = 100,
-        date: datetime = datetime.now()
-    ) -> List[int]:
+        date: Optional[datetime] = None
+    ) -> bytearray:
         """Create a protocol header for LED badge communication.
         
         Args:
@@ -241,19 +253,22 @@ class LedNameBadge:
             blinks: Blinking flag (0 or 1) for each message
             ants: Animated border flag (0 or 1) for each message
             brightness: Display brightness (25, 50, 75, or 100 percent)
-            date: Timestamp to embed in header (not displayed on device)
+            date: Timestamp to embed in header (not displayed on device),
+                defaults to the current time
             
         Returns:
-            Protocol header as list of bytes
+            Protocol header as a 64-byte bytearray
             
         Raises:
             TypeError: If parameters are not iterable or date is not datetime
             ValueError: If lengths sum is too high
         """
-        try:
-            lengths_sum = sum(lengths)
-        except:
+        if date is None:
+            date = datetime.now()
+
+        if not hasattr(lengths, '__iter__'):
             raise TypeError(f"Please give a list or tuple with at least one number: {lengths}")
+        lengths_sum = sum(lengths)
         if lengths_sum > (8192 - len(LedNameBadge._protocol_header_template)) / 11 + 1:
             raise ValueError(f"The given lengths seem to be far too high: {lengths}")
 
@@ -264,7 +279,7 @@ class LedNameBadge:
 
         speeds = [x - 1 for x in speeds]
 
-        h = list(LedNameBadge._protocol_header_template)
+        h = bytearray(LedNameBadge._protocol_header_template)
 
         if brightness <= 25:
             h[5] = 0x40
@@ -274,26 +289,20 @@ class LedNameBadge:
             h[5] = 0x10
         # else default 100% == 0x00
 
-        for i in range(8):
-            h[6] += blinks[i] << i
-            h[7] += ants[i] << i
+        h[6] = _MASK_LUT[blinks]
+        h[7] = _MASK_LUT[ants]
 
-        for i in range(8):
-            h[8 + i] = 16 * speeds[i] + modes[i]
+        h[8:16] = bytes(_SM_LUT[s][m] for s, m in zip(speeds, modes))
 
-        for i in range(len(lengths)):
-            h[17 + (2 * i) - 1] = lengths[i] // 256
-            h[17 + (2 * i)] = lengths[i] % 256
+        for i, length in enumerate(lengths):
+            h[16 + 2 * i:18 + 2 * i] = [length >> 8, length & 0xFF]
 
-        try:
-            h[38 + 0] = date.year % 100
-            h[38 + 1] = date.month
-            h[38 + 2] = date.day
-            h[38 + 3] = date.hour
-            h[38 + 4] = date.minute
-            h[38 + 5] = date.second
-        except:
-            raise TypeError(f"Please give a datetime object: {date}")
+        h[38 + 0] = date.year % 100
+        h[38 + 1] = date.month
+        h[38 + 2] = date.day
+        h[38 + 3] = date.hour
+        h[38 + 4] = date.minute
+        h[38 + 5] = date.second
 
         return h
 
@@ -315,11 +324,13 @@ class LedNameBadge:
             TypeError: If iterable is not valid
         """
         try:
-            iterable = [min(max(x, min_), max_) for x in iterable]
-            iterable = tuple(iterable) + (iterable[-1],) * (8 - len(iterable))  # repeat last element
-            return iterable
-        except:
+            clamped = tuple(min_ if x < min_ else max_ if x > max_ else x for x in iterable)
+        except TypeError:
+            raise TypeError(f"Please give a list or tuple with at least one number: {iterable}")
+        if not clamped:
             raise TypeError(f"Please give a list or tuple with at least one number: {iterable}")
+        pad = 8 - len(clamped)
+        return clamped + (clamped[-1],) * pad if pad > 0 else clamped[:8]
 
     @staticmethod
     def _print_sudo_hints() -> None:
@@ -329,7 +340,7 @@ class LedNameBadge:
         print("Or temporarily use: sudo")
 
     @staticmethod
-    def write(buf: array) -> None:
+    def write(buf: bytearray) -> None:
         """Write the given buffer to the LED badge device.
         
         The buffer must begin with a protocol header as provided by header()
@@ -7,6 +7,7 @@ Each character is represented as 11 bytes (rows) where each byte represents
 8 horizontal pixels. The display is 11 pixels tall and characters are 8 pixels wide.
 """
 
+import functools
 import re
 from array import array
 from typing import Tuple, List
@@ -191,6 +192,13 @@ class SimpleTextAndIcons:
     for i in range(len(charmap)):
         char_offsets[charmap[i]] = 11 * i
 
+    # Per-character glyphs precomputed as bytes: extending a bytearray
+    # with bytes is a C-level copy, so rendering text never loops over
+    # individual glyph rows in Python.
+    char_glyphs = {}
+    for ch, off in char_offsets.items():
+        char_glyphs[ch] = bytes(font_11x44[off:off + 11])
+
     bitmap_named = {
         'ball':      (array('B', (
             0b00000000,
@@ -225,21 +233,22 @@ class SimpleTextAndIcons:
         return self.bitmaps_preloaded_unused is True
 
     @staticmethod
-    def _get_named_bitmaps_keys() -> List[str]:
-        """Get list of available named bitmap icons."""
-        return list(SimpleTextAndIcons.bitmap_named.keys())
+    @functools.lru_cache(maxsize=1)
+    def _get_named_bitmaps_keys() -> Tuple[str, ...]:
+        """Get the names of the available builtin bitmap icons (cached)."""
+        return tuple(SimpleTextAndIcons.bitmap_named.keys())
 
-    def bitmap_char(self, ch: str) -> Tuple[array, int]:
+    def bitmap_char(self, ch: str) -> Tuple[bytes, int]:
         """Returns a tuple of (bitmap_data, width) for the given character.
         
         Args:
             ch: Character to convert to bitmap
             
         Returns:
-            Tuple of (array of 11 bytes, character width in columns)
+            Tuple of (11 bytes of glyph data, character width in columns)
             
         Example:
-            ch = '_' returns (array of 11 bytes, 1)
+            ch = '_' returns (11 bytes, 1)
             The bits in each byte are horizontal, highest bit is left.
         """
         if ord(ch) < 32:
@@ -249,10 +258,9 @@ class SimpleTextAndIcons:
             self.bitmaps_preloaded_unused = False
             return self.bitmap_preloaded[ord(ch)]
 
-        o = SimpleTextAndIcons.char_offsets[ch]
-        return SimpleTextAndIcons.font_11x44[o:o + 11], 1
+        return SimpleTextAndIcons.char_glyphs[ch], 1
 
-    def bitmap_text(self, text: str) -> Tuple[array, int]:
+    def bitmap_text(self, text: str) -> Tuple[bytearray, int]:
         """Convert text string to bitmap data.
         
         Preprocesses the text string for substitution patterns:
@@ -281,7 +289,7 @@ class SimpleTextAndIcons:
             return SimpleTextAndIcons.bitmap_named[name][2]
 
         text = re.sub(r':([^:]*):', replace_symbolic, text)
-        buf = array('B')
+        buf = bytearray()
         cols = 0
         for c in text:
             (b, n) = self.bitmap_char(c)
@@ -289,7 +297,7 @@ class SimpleTextAndIcons:
             cols += n
         return buf, cols
 
-    def bitmap(self, arg: str) -> Tuple[array, int]:
+    def bitmap(self, arg: str) -> Tuple[bytearray, int]:
         """Convert string or image path to bitmap data.
         
         If arg is a valid and existing path name, we load it as an image.
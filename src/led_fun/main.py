@@ -1,30 +1,14 @@
-import usb.core
-import usb.util
-
-def get_available_devices():
-    devices = {}
-    devs = usb.core.find(idVendor=0x0416, idProduct=0x5020, find_all=True)
-
-    for d in devs:
-        cfg = d.get_active_configuration()[0, 0]
-        eps = usb.util.find_descriptor(cfg, find_all=True, 
-            custom_match=lambda e: usb.util.endpoint_direction(e.bEndpointAddress) == usb.util.ENDPOINT_OUT)
-        for ep in eps:
-            did = "%d:%d:%d" % (d.bus, d.address, ep.bEndpointAddress)
-            descr = ("%s - %s (bus=%d dev=%d endpoint=%d)" % 
-                (d.manufacturer, d.product, d.bus, d.address, ep.bEndpointAddress))
-            devices[did] = (descr, d, ep)
-    return devices
+from led_fun.device import WriteLibUsb
 
 
 def main():
-    devs = get_available_devices()
-    if (len(devs) == 0):
+    devs = WriteLibUsb().get_available_devices()
+    if len(devs) == 0:
         print("No device found")
         return
     print(f"Found {len(devs)} device(s):")
-    for did, (descr, d, ep) in devs.items():
+    for did, descr in devs.items():
         print(f"  [{did}] {descr}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()